@@ -7,6 +7,7 @@ import logging
 import os
 
 import psycopg2
+import psycopg2.extensions
 import psycopg2.extras
 
 logger = logging.getLogger(__name__)
@@ -226,14 +227,23 @@ class Database:
         db.close()
     """
 
-    def __init__(self, dsn: dict | None = None, **kwargs) -> None:
+    def __init__(self, dsn: dict | str | None = None, **kwargs) -> None:
+        # A libpq connection string or postgresql:// URI is parsed into
+        # keywords so it merges with the defaults like a dict would.
+        if isinstance(dsn, str):
+            dsn = psycopg2.extensions.parse_dsn(dsn)
         self.dsn = {**DEFAULT_DSN, **(dsn or {}), **kwargs}
         self._conn = None
 
     def connect(self):
-        """Open connection to PostgreSQL."""
+        """Open connection to PostgreSQL.
+
+        The connection runs in autocommit mode: writes are grouped by
+        explicit ``with conn:`` blocks (BEGIN ... COMMIT/ROLLBACK), and
+        plain reads never leave the session idle in a transaction.
+        """
         self._conn = psycopg2.connect(**self.dsn)
-        self._conn.autocommit = False
+        self._conn.autocommit = True
         return self._conn
 
     @property
@@ -8,6 +8,8 @@ Batch methods wrap multiple upserts in a single atomic transaction.
 Read methods return dicts for easy consumption.
 """
 
+import psycopg2.extras
+
 # ---------------------------------------------------------------------------
 # UPSERT SQL constants (PostgreSQL syntax)
 # ---------------------------------------------------------------------------
@@ -221,7 +223,9 @@ class MatchRepository:
     """Data access layer for HLTV match data.
 
     Wraps all database write and read operations. Receives a psycopg2
-    connection. Write methods use transactions for atomicity.
+    connection in autocommit mode. Every write method runs inside one
+    explicit ``with self.conn`` transaction, so a batch is committed in a
+    single step or rolled back as a whole.
     """
 
     def __init__(self, conn) -> None:
@@ -234,11 +238,14 @@ class MatchRepository:
                 cur.execute(sql, params)
 
     def _executemany(self, sql, params_list):
-        """Execute a statement for each param dict within a transaction."""
+        """Execute a statement for each param dict within a transaction.
+
+        Rows are sent with ``execute_batch``, which joins them into a few
+        multi-statement round trips instead of one per row.
+        """
         with self.conn:
             with self.conn.cursor() as cur:
-                for params in params_list:
-                    cur.execute(sql, params)
+                psycopg2.extras.execute_batch(cur, sql, params_list)
 
     # ------------------------------------------------------------------
     # Single-row UPSERT methods
@@ -263,12 +270,14 @@ class MatchRepository:
     # Batch UPSERT methods (atomic transactions)
     # ------------------------------------------------------------------
 
+    def upsert_matches(self, matches_data: list[dict]) -> None:
+        self._executemany(UPSERT_MATCH, matches_data)
+
     def upsert_match_maps(self, match_data: dict, maps_data: list[dict]) -> None:
         with self.conn:
             with self.conn.cursor() as cur:
                 cur.execute(UPSERT_MATCH, match_data)
-                for map_data in maps_data:
-                    cur.execute(UPSERT_MAP, map_data)
+                psycopg2.extras.execute_batch(cur, UPSERT_MAP, maps_data)
 
     def upsert_match_overview(
         self,
@@ -279,20 +288,16 @@ class MatchRepository:
         with self.conn:
             with self.conn.cursor() as cur:
                 cur.execute(UPSERT_MATCH, match_data)
-                for map_data in maps_data:
-                    cur.execute(UPSERT_MAP, map_data)
-                for veto in vetoes_data:
-                    cur.execute(UPSERT_VETO, veto)
+                psycopg2.extras.execute_batch(cur, UPSERT_MAP, maps_data)
+                psycopg2.extras.execute_batch(cur, UPSERT_VETO, vetoes_data)
 
     def upsert_map_stats_complete(
         self, stats_data: list[dict], rounds_data: list[dict]
     ) -> None:
         with self.conn:
             with self.conn.cursor() as cur:
-                for row in stats_data:
-                    cur.execute(UPSERT_PLAYER_STATS, row)
-                for row in rounds_data:
-                    cur.execute(UPSERT_ROUND, row)
+                psycopg2.extras.execute_batch(cur, UPSERT_PLAYER_STATS, stats_data)
+                psycopg2.extras.execute_batch(cur, UPSERT_ROUND, rounds_data)
 
     def upsert_map_player_stats(self, stats_data: list[dict]) -> None:
         self._executemany(UPSERT_PLAYER_STATS, stats_data)
@@ -314,24 +319,21 @@ class MatchRepository:
     ) -> None:
         with self.conn:
             with self.conn.cursor() as cur:
-                for row in perf_stats:
-                    cur.execute(UPSERT_PLAYER_STATS, row)
-                for row in economy_data:
-                    cur.execute(UPSERT_ECONOMY, row)
-                for row in kill_matrix_data:
-                    cur.execute(UPSERT_KILL_MATRIX, row)
+                psycopg2.extras.execute_batch(cur, UPSERT_PLAYER_STATS, perf_stats)
+                psycopg2.extras.execute_batch(cur, UPSERT_ECONOMY, economy_data)
+                psycopg2.extras.execute_batch(cur, UPSERT_KILL_MATRIX, kill_matrix_data)
 
     # ------------------------------------------------------------------
     # Read methods
     # ------------------------------------------------------------------
 
     def _fetchall_dicts(self, sql, params=None) -> list[dict]:
-        with self.conn.cursor(cursor_factory=__import__('psycopg2.extras', fromlist=['RealDictCursor']).RealDictCursor) as cur:
+        with self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
             cur.execute(sql, params)
             return [dict(r) for r in cur.fetchall()]
 
     def _fetchone_dict(self, sql, params=None) -> dict | None:
-        with self.conn.cursor(cursor_factory=__import__('psycopg2.extras', fromlist=['RealDictCursor']).RealDictCursor) as cur:
+        with self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
             cur.execute(sql, params)
             row = cur.fetchone()
             return dict(row) if row else None
@@ -452,18 +454,12 @@ class MatchRepository:
         with self.conn:
             with self.conn.cursor() as cur:
                 cur.execute(UPSERT_MATCH, match_data)
-                for row in maps_data:
-                    cur.execute(UPSERT_MAP, row)
-                for row in vetoes_data:
-                    cur.execute(UPSERT_VETO, row)
-                for row in all_stats:
-                    cur.execute(UPSERT_PLAYER_STATS, row)
-                for row in all_rounds:
-                    cur.execute(UPSERT_ROUND, row)
-                for row in all_economy:
-                    cur.execute(UPSERT_ECONOMY, row)
-                for row in all_kill_matrix:
-                    cur.execute(UPSERT_KILL_MATRIX, row)
+                psycopg2.extras.execute_batch(cur, UPSERT_MAP, maps_data)
+                psycopg2.extras.execute_batch(cur, UPSERT_VETO, vetoes_data)
+                psycopg2.extras.execute_batch(cur, UPSERT_PLAYER_STATS, all_stats)
+                psycopg2.extras.execute_batch(cur, UPSERT_ROUND, all_rounds)
+                psycopg2.extras.execute_batch(cur, UPSERT_ECONOMY, all_economy)
+                psycopg2.extras.execute_batch(cur, UPSERT_KILL_MATRIX, all_kill_matrix)
 
     def delete_match_data(self, match_id: int) -> None:
         """Delete all data for a match across all tables."""
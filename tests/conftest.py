@@ -0,0 +1,176 @@
+"""Shared pytest fixtures.
+
+``storage`` is an HtmlStorage rooted in the test's tmp_path, and
+``parsed_offset_*`` are results-page samples parsed once per session
+(skipped when data/recon/ lacks them).
+
+Database fixtures run against the PostgreSQL database named by
+HLTV_TEST_DB_NAME (default ``hltv_test``, never the scraper's own
+database) or the full DSN in HLTV_TEST_DSN, one schema per pytest-xdist
+worker.  The schema is created once per session and every test runs
+inside a transaction that is rolled back afterwards; tests skip
+gracefully if the server is unreachable.
+"""
+
+import functools
+import gzip
+import os
+from pathlib import Path
+
+import psycopg2
+import psycopg2.extensions
+import pytest
+
+from scraper.db import DEFAULT_DSN, SCHEMA_DDL, Database
+from scraper.discovery import DiscoveredMatch, parse_results_page
+from scraper.repository import MatchRepository
+from scraper.storage import HtmlStorage
+
+TEST_DB_NAME = os.getenv("HLTV_TEST_DB_NAME", "hltv_test")
+# A full libpq DSN or postgresql:// URI, e.g. for a throwaway server on a
+# tmpfs data directory.  A dbname in it overrides HLTV_TEST_DB_NAME.
+TEST_DB_URL = os.getenv("HLTV_TEST_DSN")
+
+# Each pytest-xdist worker gets its own schema, so parallel workers never
+# wait on each other's uncommitted rows or on the setup's table locks.
+_XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+TEST_SCHEMA = f"test_{_XDIST_WORKER}" if _XDIST_WORKER else "public"
+# TEST_DB_NAME stays the fallback so a DSN without a dbname can never
+# resolve to the scraper's own database through DEFAULT_DSN.
+TEST_DSN = {
+    "dbname": TEST_DB_NAME,
+    **psycopg2.extensions.parse_dsn(TEST_DB_URL or ""),
+}
+SEARCH_PATH = f"-c search_path={TEST_SCHEMA}"
+
+# Tables the tests write to.  Ordered children first, as foreign keys
+# require for SET UNLOGGED.
+DATA_TABLES = (
+    "economy", "kill_matrix", "round_history", "player_stats",
+    "vetoes", "maps", "matches", "quarantine",
+)
+
+
+class SavepointConnection(psycopg2.extensions.connection):
+    """psycopg2 connection whose ``with conn:`` blocks become savepoints.
+
+    MatchRepository wraps every write in ``with self.conn``, which would
+    normally COMMIT.  Inside the per-test transaction opened by the ``db``
+    fixture each block is a savepoint instead -- released on success,
+    rolled back on error -- so batch atomicity still holds and teardown
+    discards everything the test wrote with a single ROLLBACK.
+    """
+
+    def __enter__(self):
+        with self.cursor() as cur:
+            cur.execute("SAVEPOINT repo_write")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        with self.cursor() as cur:
+            if exc_type is not None:
+                cur.execute("ROLLBACK TO SAVEPOINT repo_write")
+            cur.execute("RELEASE SAVEPOINT repo_write")
+        return False
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="session")
+def session_db():
+    """Create the schema once, then share one connection across the session."""
+    setup = Database(TEST_DSN, options=SEARCH_PATH)
+    # Setup truncates every data table; never point it at the real data
+    if setup.dsn["dbname"] == DEFAULT_DSN["dbname"]:
+        pytest.exit(
+            f"Refusing to run tests against the scraper database "
+            f"{DEFAULT_DSN['dbname']!r}; set HLTV_TEST_DB_NAME or HLTV_TEST_DSN",
+            returncode=1,
+        )
+    try:
+        setup.connect()
+    except psycopg2.OperationalError as exc:
+        pytest.skip(f"PostgreSQL test database not available: {exc}")
+    with setup.conn, setup.conn.cursor() as cur:
+        cur.execute(f"CREATE SCHEMA IF NOT EXISTS {TEST_SCHEMA}")
+        cur.execute(SCHEMA_DDL)
+        # UNLOGGED tables bypass the WAL entirely -- the closest PostgreSQL
+        # gets to an in-memory database while keeping the real schema.
+        for table in DATA_TABLES:
+            cur.execute(f"ALTER TABLE {table} SET UNLOGGED")
+        # Tests never commit, but clear anything an older run left behind
+        cur.execute(f"TRUNCATE {', '.join(DATA_TABLES)} RESTART IDENTITY")
+    setup.close()
+
+    database = Database(
+        TEST_DSN, options=SEARCH_PATH, connection_factory=SavepointConnection
+    )
+    database.connect()
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def db(session_db):
+    """Run the test inside one transaction and roll it back afterwards."""
+    with session_db.conn.cursor() as cur:
+        cur.execute("BEGIN")
+    yield session_db
+    with session_db.conn.cursor() as cur:
+        cur.execute("ROLLBACK")
+
+
+@pytest.fixture
+def repo(db):
+    return MatchRepository(db.conn)
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return HtmlStorage(tmp_path)
+
+
+# ---------------------------------------------------------------------------
+# Recon HTML samples
+# ---------------------------------------------------------------------------
+
+RECON_DIR = Path(__file__).resolve().parent.parent / "data" / "recon"
+
+
+@functools.cache
+def _read_sample(filename: str) -> str | None:
+    """Decompress a sample once per session; None if it is missing."""
+    path = RECON_DIR / filename
+    if not path.exists():
+        return None
+    return gzip.decompress(path.read_bytes()).decode("utf-8")
+
+
+def load_sample(filename: str) -> str:
+    """Load a gzipped HTML sample from data/recon/."""
+    html = _read_sample(filename)
+    if html is None:
+        pytest.skip(f"Sample HTML not found: {RECON_DIR / filename}")
+    return html
+
+
+# ---------------------------------------------------------------------------
+# Results-page samples: each page is parsed once per session
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def parsed_offset_0() -> list[DiscoveredMatch]:
+    return parse_results_page(load_sample("results-offset-0.html.gz"))
+
+
+@pytest.fixture(scope="session")
+def parsed_offset_100() -> list[DiscoveredMatch]:
+    return parse_results_page(load_sample("results-offset-100.html.gz"))
+
+
+@pytest.fixture(scope="session")
+def parsed_offset_5000() -> list[DiscoveredMatch]:
+    return parse_results_page(load_sample("results-offset-5000.html.gz"))
@@ -4,7 +4,7 @@ import sqlite3
 
 import pytest
 
-from scraper.db import Database
+from scraper.db import DEFAULT_DSN, Database
 
 
 class TestDatabaseCreation:
@@ -168,3 +168,25 @@ class TestDatabaseForeignKeys:
                 """
             )
         db.close()
+
+
+class TestDatabaseDsn:
+    """Tests for building connection parameters from a DSN string."""
+
+    def test_libpq_string_merges_over_defaults(self):
+        db = Database("host=/tmp port=5499")
+        assert db.dsn["host"] == "/tmp"
+        assert db.dsn["port"] == "5499"
+        assert db.dsn["user"] == DEFAULT_DSN["user"]
+        assert db.dsn["dbname"] == DEFAULT_DSN["dbname"]
+
+    def test_uri_merges_over_defaults(self):
+        db = Database("postgresql://me@localhost:5432")
+        assert db.dsn["user"] == "me"
+        assert db.dsn["host"] == "localhost"
+        assert db.dsn["port"] == "5432"
+        assert db.dsn["password"] == DEFAULT_DSN["password"]
+
+    def test_explicit_dbname_wins(self):
+        assert Database("host=/tmp dbname=hltv_test").dsn["dbname"] == "hltv_test"
+        assert Database("postgresql://me@localhost/hltv_test").dsn["dbname"] == "hltv_test"
@@ -1,177 +1,382 @@
 """Tests for the MatchRepository UPSERT and read operations.
 
 Exercises every repository method and verifies UPSERT semantics,
-foreign key enforcement, batch atomicity, and read methods.
+foreign key enforcement, batch atomicity, and read methods.  The
+``db`` and ``repo`` fixtures live in conftest.py.
 """
 
-import sqlite3
+import functools
+from unittest.mock import patch
 
+import psycopg2
+import psycopg2.extras
 import pytest
 
-from scraper.db import Database
 from scraper.repository import MatchRepository
 
-
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
 @pytest.fixture
-def db(tmp_path):
-    database = Database(tmp_path / "test.db")
-    database.initialize()
-    yield database
-    database.close()
-
-
-@pytest.fixture
-def repo(db):
-    return MatchRepository(db.conn)
+def seeded_repo(repo):
+    """Repository with match 1 and its map 1 already inserted."""
+    repo.upsert_match_maps(make_match_data(match_id=1), [make_map_data(match_id=1, map_number=1)])
+    return repo
 
 
 # ---------------------------------------------------------------------------
 # Data helpers
 # ---------------------------------------------------------------------------
 
-def make_match_data(match_id=1, **overrides):
-    """Return a complete match dict with sensible defaults."""
-    data = {
+# Direct reads for tables without a repository read method
+SELECT_ROUND = (
+    "SELECT winner_side FROM round_history "
+    "WHERE match_id = %s AND map_number = %s AND round_number = %s"
+)
+SELECT_ECONOMY = (
+    "SELECT equipment_value, buy_type FROM economy "
+    "WHERE match_id = %s AND map_number = %s AND round_number = %s AND team_id = %s"
+)
+COUNT_ROUNDS = (
+    "SELECT COUNT(*) AS n FROM round_history WHERE match_id = %s AND map_number = %s"
+)
+
+# Plain inserts for vetoes, which have no single-row repository upsert
+INSERT_VETO_POSITIONAL = (
+    "INSERT INTO vetoes (match_id, step_number, team_name, action, map_name, "
+    "scraped_at, updated_at, source_url, parser_version) "
+    "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)"
+)
+INSERT_VETO = (
+    "INSERT INTO vetoes (match_id, step_number, team_name, action, map_name, "
+    "scraped_at, updated_at, source_url, parser_version) "
+    "VALUES (%(match_id)s, %(step_number)s, %(team_name)s, %(action)s, %(map_name)s, "
+    "%(scraped_at)s, %(scraped_at)s, %(source_url)s, %(parser_version)s)"
+)
+
+
+class RecordingConnection:
+    """Stand-in connection that records the SQL a repository sends.
+
+    Serves as its own transaction and cursor context manager, which is
+    all MatchRepository's write path needs.
+    """
+
+    def __init__(self):
+        self.statements = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def cursor(self):
+        return self
+
+    def execute(self, sql, params=None):
+        self.statements.append(sql)
+
+
+def fetch_one(conn, sql, params=None):
+    """Run a read query directly and return the first row as a dict."""
+    with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        cur.execute(sql, params)
+        return cur.fetchone()
+
+
+# Values shared by every row the helpers build
+_SCRAPED_AT = "2025-06-16T10:00:00Z"
+_PARSER_VERSION = "0.1.0"
+_MAPSTATS_URL = "https://www.hltv.org/stats/matches/mapstatsid/178001/navi-vs-g2"
+
+# Constant parts of each row; the helpers below fill in keys and URLs.
+_MATCH_BASE = {
+    "date": "2025-06-15",
+    "date_unix_ms": 1750000000000,
+    "event_id": 7148,
+    "event_name": "BLAST Premier Spring Final 2025",
+    "team1_id": 4608,
+    "team1_name": "Natus Vincere",
+    "team2_id": 5995,
+    "team2_name": "G2 Esports",
+    "team1_score": 2,
+    "team2_score": 1,
+    "best_of": 3,
+    "is_lan": 1,
+    "scraped_at": _SCRAPED_AT,
+    "parser_version": _PARSER_VERSION,
+}
+
+_MAP_BASE = {
+    "map_name": "Inferno",
+    "team1_rounds": 16,
+    "team2_rounds": 12,
+    "team1_ct_rounds": 9,
+    "team1_t_rounds": 7,
+    "team2_ct_rounds": 7,
+    "team2_t_rounds": 5,
+    "scraped_at": _SCRAPED_AT,
+    "parser_version": _PARSER_VERSION,
+}
+
+_PLAYER_STATS_BASE = {
+    "team_id": 4608,
+    "kills": 22,
+    "deaths": 15,
+    "assists": 4,
+    "flash_assists": 2,
+    "hs_kills": 10,
+    "kd_diff": 7,
+    "adr": 85.3,
+    "kast": 72.0,
+    "fk_diff": 2,
+    "rating": 1.30,
+    "kpr": 0.85,
+    "dpr": 0.58,
+    "opening_kills": 3,
+    "opening_deaths": 1,
+    "multi_kills": 2,
+    "clutch_wins": 1,
+    "traded_deaths": 4,
+    "round_swing": 1.5,
+    "mk_rating": 1.10,
+    "e_kills": None,
+    "e_deaths": None,
+    "e_hs_kills": None,
+    "e_kd_diff": None,
+    "e_adr": None,
+    "e_kast": None,
+    "e_opening_kills": None,
+    "e_opening_deaths": None,
+    "e_fk_diff": None,
+    "e_traded_deaths": None,
+    "scraped_at": _SCRAPED_AT,
+    "source_url": _MAPSTATS_URL,
+    "parser_version": _PARSER_VERSION,
+}
+
+_ROUND_BASE = {
+    "winner_side": "CT",
+    "win_type": "elimination",
+    "winner_team_id": 4608,
+    "scraped_at": _SCRAPED_AT,
+    "source_url": _MAPSTATS_URL,
+    "parser_version": _PARSER_VERSION,
+}
+
+_ECONOMY_BASE = {
+    "equipment_value": 26500,
+    "buy_type": "full",
+    "scraped_at": _SCRAPED_AT,
+    "source_url": _MAPSTATS_URL,
+    "parser_version": _PARSER_VERSION,
+}
+
+_VETO_BASE = {
+    "team_name": "TeamA",
+    "action": "removed",
+    "map_name": "Nuke",
+    "scraped_at": _SCRAPED_AT,
+    "parser_version": _PARSER_VERSION,
+}
+
+
+@functools.cache
+def _match_url(match_id):
+    return f"https://www.hltv.org/matches/{match_id}/navi-vs-g2"
+
+
+@functools.cache
+def _mapstats_url(mapstatsid):
+    return f"https://www.hltv.org/stats/matches/mapstatsid/{mapstatsid}/navi-vs-g2"
+
+
+def _build_match_data(match_id, overrides):
+    url = _match_url(match_id)
+    return {
+        **_MATCH_BASE,
         "match_id": match_id,
-        "date": "2025-06-15",
-        "date_unix_ms": 1750000000000,
-        "event_id": 7148,
-        "event_name": "BLAST Premier Spring Final 2025",
-        "team1_id": 4608,
-        "team1_name": "Natus Vincere",
-        "team2_id": 5995,
-        "team2_name": "G2 Esports",
-        "team1_score": 2,
-        "team2_score": 1,
-        "best_of": 3,
-        "is_lan": 1,
-        "match_url": f"https://www.hltv.org/matches/{match_id}/navi-vs-g2",
-        "scraped_at": "2025-06-16T10:00:00Z",
-        "source_url": f"https://www.hltv.org/matches/{match_id}/navi-vs-g2",
-        "parser_version": "0.1.0",
+        "match_url": url,
+        "source_url": url,
+        **overrides,
     }
-    data.update(overrides)
-    return data
+
+
+# Most tests ask for the plain default match; build it once
+_DEFAULT_MATCH = _build_match_data(1, {})
+
+
+def make_match_data(match_id=1, **overrides):
+    """Return a complete match dict with sensible defaults."""
+    if match_id == 1 and not overrides:
+        return dict(_DEFAULT_MATCH)
+    return _build_match_data(match_id, overrides)
 
 
 def make_map_data(match_id=1, map_number=1, **overrides):
     """Return a complete map dict with sensible defaults."""
-    data = {
+    mapstatsid = 178000 + map_number
+    return {
+        **_MAP_BASE,
         "match_id": match_id,
         "map_number": map_number,
-        "mapstatsid": 178000 + map_number,
-        "map_name": "Inferno",
-        "team1_rounds": 16,
-        "team2_rounds": 12,
-        "team1_ct_rounds": 9,
-        "team1_t_rounds": 7,
-        "team2_ct_rounds": 7,
-        "team2_t_rounds": 5,
-        "scraped_at": "2025-06-16T10:00:00Z",
-        "source_url": f"https://www.hltv.org/stats/matches/mapstatsid/{178000 + map_number}/navi-vs-g2",
-        "parser_version": "0.1.0",
+        "mapstatsid": mapstatsid,
+        "source_url": _mapstats_url(mapstatsid),
+        **overrides,
     }
-    data.update(overrides)
-    return data
 
 
 def make_player_stats_data(match_id=1, map_number=1, player_id=1, **overrides):
     """Return a complete player_stats dict with sensible defaults."""
-    data = {
+    return {
+        **_PLAYER_STATS_BASE,
         "match_id": match_id,
         "map_number": map_number,
         "player_id": player_id,
         "player_name": f"Player{player_id}",
-        "team_id": 4608,
-        "kills": 22,
-        "deaths": 15,
-        "assists": 4,
-        "flash_assists": 2,
-        "hs_kills": 10,
-        "kd_diff": 7,
-        "adr": 85.3,
-        "kast": 72.0,
-        "fk_diff": 2,
-        "rating": 1.30,
-        "kpr": 0.85,
-        "dpr": 0.58,
-        "opening_kills": 3,
-        "opening_deaths": 1,
-        "multi_kills": 2,
-        "clutch_wins": 1,
-        "traded_deaths": 4,
-        "round_swing": 1.5,
-        "mk_rating": 1.10,
-        "e_kills": None,
-        "e_deaths": None,
-        "e_hs_kills": None,
-        "e_kd_diff": None,
-        "e_adr": None,
-        "e_kast": None,
-        "e_opening_kills": None,
-        "e_opening_deaths": None,
-        "e_fk_diff": None,
-        "e_traded_deaths": None,
-        "scraped_at": "2025-06-16T10:00:00Z",
-        "source_url": f"https://www.hltv.org/stats/matches/mapstatsid/178001/navi-vs-g2",
-        "parser_version": "0.1.0",
+        **overrides,
     }
-    data.update(overrides)
-    return data
 
 
 def make_round_data(match_id=1, map_number=1, round_number=1, **overrides):
     """Return a complete round_history dict with sensible defaults."""
-    data = {
+    return {
+        **_ROUND_BASE,
         "match_id": match_id,
         "map_number": map_number,
         "round_number": round_number,
-        "winner_side": "CT",
-        "win_type": "elimination",
-        "winner_team_id": 4608,
-        "scraped_at": "2025-06-16T10:00:00Z",
-        "source_url": f"https://www.hltv.org/stats/matches/mapstatsid/178001/navi-vs-g2",
-        "parser_version": "0.1.0",
+        **overrides,
     }
-    data.update(overrides)
-    return data
 
 
 def make_economy_data(match_id=1, map_number=1, round_number=1, team_id=100, **overrides):
     """Return a complete economy dict with sensible defaults."""
-    data = {
+    return {
+        **_ECONOMY_BASE,
         "match_id": match_id,
         "map_number": map_number,
         "round_number": round_number,
         "team_id": team_id,
-        "equipment_value": 26500,
-        "buy_type": "full",
-        "scraped_at": "2025-06-16T10:00:00Z",
-        "source_url": f"https://www.hltv.org/stats/matches/mapstatsid/178001/navi-vs-g2",
-        "parser_version": "0.1.0",
+        **overrides,
     }
-    data.update(overrides)
-    return data
 
 
 def make_veto_data(match_id=1, step_number=1, **overrides):
     """Return a complete vetoes dict with sensible defaults."""
-    data = {
+    return {
+        **_VETO_BASE,
         "match_id": match_id,
         "step_number": step_number,
-        "team_name": "TeamA",
-        "action": "removed",
-        "map_name": "Nuke",
-        "scraped_at": "2025-06-16T10:00:00Z",
-        "source_url": f"https://www.hltv.org/matches/{match_id}/navi-vs-g2",
-        "parser_version": "0.1.0",
+        "source_url": _match_url(match_id),
+        **overrides,
     }
-    data.update(overrides)
-    return data
+
+
+# ---------------------------------------------------------------------------
+# UPSERT - Single row: insert into each table
+# ---------------------------------------------------------------------------
+
+def _check_match_inserted(repo):
+    """get_match returns the new match."""
+    m = repo.get_match(1)
+    assert m is not None
+    assert m["match_id"] == 1
+    assert m["team1_name"] == "Natus Vincere"
+    assert m["team2_name"] == "G2 Esports"
+    assert m["best_of"] == 3
+
+
+def _check_map_inserted(repo):
+    """get_maps returns the new map."""
+    maps = repo.get_maps(1)
+    assert len(maps) == 1
+    assert maps[0]["map_name"] == "Inferno"
+    assert maps[0]["map_number"] == 1
+
+
+def _check_player_stats_inserted(repo):
+    """get_player_stats returns the new row."""
+    stats = repo.get_player_stats(1, 1)
+    assert len(stats) == 1
+    assert stats[0]["player_id"] == 10
+    assert stats[0]["kills"] == 22
+
+
+def _check_round_inserted(repo):
+    """Read directly -- no dedicated read method for rounds."""
+    row = fetch_one(repo.conn, SELECT_ROUND, (1, 1, 1))
+    assert row is not None
+    assert row["winner_side"] == "CT"
+
+
+def _check_economy_inserted(repo):
+    """Read directly -- no dedicated read method for economy."""
+    row = fetch_one(repo.conn, SELECT_ECONOMY, (1, 1, 1, 100))
+    assert row is not None
+    assert row["equipment_value"] == 26500
+    assert row["buy_type"] == "full"
+
+
+# Parent chain for the insert cases below: match -> map -> round
+_PARENT_ROWS = [
+    ("upsert_match", make_match_data(match_id=1)),
+    ("upsert_map", make_map_data(match_id=1, map_number=1)),
+    ("upsert_round", make_round_data(match_id=1, map_number=1, round_number=1)),
+]
+
+# (number of _PARENT_ROWS to insert first, method under test, row, check)
+INSERT_CASES = [
+    pytest.param(
+        0, "upsert_match", make_match_data(match_id=1),
+        _check_match_inserted, id="match",
+    ),
+    pytest.param(
+        1, "upsert_map", make_map_data(match_id=1, map_number=1, map_name="Inferno"),
+        _check_map_inserted, id="map",
+    ),
+    pytest.param(
+        2, "upsert_player_stats",
+        make_player_stats_data(match_id=1, map_number=1, player_id=10),
+        _check_player_stats_inserted, id="player_stats",
+    ),
+    pytest.param(
+        2, "upsert_round", make_round_data(match_id=1, map_number=1, round_number=1),
+        _check_round_inserted, id="round",
+    ),
+    pytest.param(
+        3, "upsert_economy",
+        make_economy_data(match_id=1, map_number=1, round_number=1, team_id=100),
+        _check_economy_inserted, id="economy",
+    ),
+]
+
+
+class TestUpsertInsert:
+    @pytest.mark.parametrize("n_parents, method, row, check", INSERT_CASES)
+    def test_upsert_insert(self, repo, n_parents, method, row, check):
+        """Insert a row (after its parents); the table's read path returns it."""
+        for parent_method, parent_row in _PARENT_ROWS[:n_parents]:
+            getattr(repo, parent_method)(parent_row)
+        getattr(repo, method)(row)
+        check(repo)
+
+
+# (method under test, row) -- the insert cases without parents or checks
+STATEMENT_CASES = [
+    pytest.param(*case.values[1:3], id=case.id) for case in INSERT_CASES
+]
+
+
+class TestUpsertStatements:
+    @pytest.mark.parametrize("method, row", STATEMENT_CASES)
+    def test_upsert_is_single_statement(self, method, row):
+        """Each single-row upsert is one native INSERT ... ON CONFLICT statement."""
+        conn = RecordingConnection()
+        getattr(MatchRepository(conn), method)(row)
+        assert len(conn.statements) == 1
+        assert "ON CONFLICT" in conn.statements[0]
 
 
 # ---------------------------------------------------------------------------
@@ -179,16 +384,6 @@ def make_veto_data(match_id=1, step_number=1, **overrides):
 # ---------------------------------------------------------------------------
 
 class TestUpsertMatch:
-    def test_upsert_match_insert(self, repo):
-        """Insert new match, get_match returns it."""
-        repo.upsert_match(make_match_data(match_id=1))
-        m = repo.get_match(1)
-        assert m is not None
-        assert m["match_id"] == 1
-        assert m["team1_name"] == "Natus Vincere"
-        assert m["team2_name"] == "G2 Esports"
-        assert m["best_of"] == 3
-
     def test_upsert_match_update(self, repo):
         """Upsert same match_id with different data, verify updated and only 1 row."""
         repo.upsert_match(make_match_data(match_id=1, team1_score=2))
@@ -210,15 +405,6 @@ class TestUpsertMatch:
 # ---------------------------------------------------------------------------
 
 class TestUpsertMap:
-    def test_upsert_map_insert(self, repo):
-        """Insert map (after parent match), get_maps returns it."""
-        repo.upsert_match(make_match_data(match_id=1))
-        repo.upsert_map(make_map_data(match_id=1, map_number=1, map_name="Inferno"))
-        maps = repo.get_maps(1)
-        assert len(maps) == 1
-        assert maps[0]["map_name"] == "Inferno"
-        assert maps[0]["map_number"] == 1
-
     def test_upsert_map_update(self, repo):
         """Upsert same (match_id, map_number) with changed map_name, verify updated."""
         repo.upsert_match(make_match_data(match_id=1))
@@ -234,72 +420,20 @@ class TestUpsertMap:
 # ---------------------------------------------------------------------------
 
 class TestUpsertPlayerStats:
-    def test_upsert_player_stats_insert(self, repo):
-        """Insert player stats (after match + map), get_player_stats returns it."""
-        repo.upsert_match(make_match_data(match_id=1))
-        repo.upsert_map(make_map_data(match_id=1, map_number=1))
-        repo.upsert_player_stats(make_player_stats_data(match_id=1, map_number=1, player_id=10))
-        stats = repo.get_player_stats(1, 1)
-        assert len(stats) == 1
-        assert stats[0]["player_id"] == 10
-        assert stats[0]["kills"] == 22
-
-    def test_upsert_player_stats_update(self, repo):
+    def test_upsert_player_stats_update(self, seeded_repo):
         """Upsert with changed kills/deaths, verify updated."""
-        repo.upsert_match(make_match_data(match_id=1))
-        repo.upsert_map(make_map_data(match_id=1, map_number=1))
-        repo.upsert_player_stats(make_player_stats_data(
+        seeded_repo.upsert_player_stats(make_player_stats_data(
             match_id=1, map_number=1, player_id=10, kills=22, deaths=15,
         ))
-        repo.upsert_player_stats(make_player_stats_data(
+        seeded_repo.upsert_player_stats(make_player_stats_data(
             match_id=1, map_number=1, player_id=10, kills=30, deaths=10,
         ))
-        stats = repo.get_player_stats(1, 1)
+        stats = seeded_repo.get_player_stats(1, 1)
         assert len(stats) == 1
         assert stats[0]["kills"] == 30
         assert stats[0]["deaths"] == 10
 
 
-# ---------------------------------------------------------------------------
-# UPSERT - Single row: round_history
-# ---------------------------------------------------------------------------
-
-class TestUpsertRound:
-    def test_upsert_round_insert(self, repo):
-        """Insert round (after match + map)."""
-        repo.upsert_match(make_match_data(match_id=1))
-        repo.upsert_map(make_map_data(match_id=1, map_number=1))
-        repo.upsert_round(make_round_data(match_id=1, map_number=1, round_number=1))
-        # Verify by reading directly -- no dedicated read method for rounds
-        row = repo.conn.execute(
-            "SELECT * FROM round_history WHERE match_id = 1 AND map_number = 1 AND round_number = 1"
-        ).fetchone()
-        assert row is not None
-        assert dict(row)["winner_side"] == "CT"
-
-
-# ---------------------------------------------------------------------------
-# UPSERT - Single row: economy
-# ---------------------------------------------------------------------------
-
-class TestUpsertEconomy:
-    def test_upsert_economy_insert(self, repo):
-        """Insert economy row (after match + map + round)."""
-        repo.upsert_match(make_match_data(match_id=1))
-        repo.upsert_map(make_map_data(match_id=1, map_number=1))
-        repo.upsert_round(make_round_data(match_id=1, map_number=1, round_number=1))
-        repo.upsert_economy(make_economy_data(
-            match_id=1, map_number=1, round_number=1, team_id=100,
-        ))
-        row = repo.conn.execute(
-            "SELECT * FROM economy WHERE match_id = 1 AND map_number = 1 "
-            "AND round_number = 1 AND team_id = 100"
-        ).fetchone()
-        assert row is not None
-        assert dict(row)["equipment_value"] == 26500
-        assert dict(row)["buy_type"] == "full"
-
-
 # ---------------------------------------------------------------------------
 # UPSERT - Batch methods
 # ---------------------------------------------------------------------------
@@ -323,15 +457,29 @@ class TestBatchUpsert:
         """upsert_map_player_stats inserts 10 player rows (2 teams x 5 players)."""
         repo.upsert_match(make_match_data(match_id=1))
         repo.upsert_map(make_map_data(match_id=1, map_number=1))
-        stats = []
-        for i in range(1, 6):
-            stats.append(make_player_stats_data(match_id=1, map_number=1, player_id=i, team_id=100))
-        for i in range(6, 11):
-            stats.append(make_player_stats_data(match_id=1, map_number=1, player_id=i, team_id=200))
+        stats = [
+            make_player_stats_data(
+                match_id=1, map_number=1, player_id=i, team_id=100 if i <= 5 else 200,
+            )
+            for i in range(1, 11)
+        ]
         repo.upsert_map_player_stats(stats)
         result = repo.get_player_stats(1, 1)
         assert len(result) == 10
 
+    def test_upsert_map_player_stats_is_one_batch(self, seeded_repo):
+        """All rows go through a single execute_batch call, not one execute each."""
+        stats = [
+            make_player_stats_data(match_id=1, map_number=1, player_id=i)
+            for i in range(1, 11)
+        ]
+        with patch(
+            "psycopg2.extras.execute_batch", wraps=psycopg2.extras.execute_batch,
+        ) as execute_batch:
+            seeded_repo.upsert_map_player_stats(stats)
+        execute_batch.assert_called_once()
+        assert execute_batch.call_args.args[2] == stats
+
     def test_upsert_map_rounds_batch(self, repo):
         """upsert_map_rounds inserts 24 rounds."""
         repo.upsert_match(make_match_data(match_id=1))
@@ -341,9 +489,7 @@ class TestBatchUpsert:
             for r in range(1, 25)
         ]
         repo.upsert_map_rounds(rounds)
-        count = repo.conn.execute(
-            "SELECT COUNT(*) FROM round_history WHERE match_id = 1 AND map_number = 1"
-        ).fetchone()[0]
+        count = fetch_one(repo.conn, COUNT_ROUNDS, (1, 1))["n"]
         assert count == 24
 
 
@@ -351,36 +497,37 @@ class TestBatchUpsert:
 # Foreign key enforcement
 # ---------------------------------------------------------------------------
 
-class TestForeignKeys:
-    def test_fk_map_without_match_raises(self, repo):
-        """upsert_map for non-existent match_id raises IntegrityError."""
-        with pytest.raises(sqlite3.IntegrityError):
-            repo.upsert_map(make_map_data(match_id=999, map_number=1))
-
-    def test_fk_player_stats_without_map_raises(self, repo):
-        """upsert_player_stats for non-existent (match_id, map_number) raises IntegrityError."""
-        repo.upsert_match(make_match_data(match_id=1))
-        # Map not inserted -- player_stats should fail
-        with pytest.raises(sqlite3.IntegrityError):
-            repo.upsert_player_stats(make_player_stats_data(
-                match_id=1, map_number=1, player_id=10,
-            ))
+# (number of _PARENT_ROWS to insert first, method under test, orphan row)
+FK_CASES = [
+    pytest.param(
+        0, "upsert_map", make_map_data(match_id=999, map_number=1),
+        id="map_without_match",
+    ),
+    pytest.param(
+        1, "upsert_player_stats",
+        make_player_stats_data(match_id=1, map_number=1, player_id=10),
+        id="player_stats_without_map",
+    ),
+    pytest.param(
+        1, "upsert_round", make_round_data(match_id=1, map_number=1, round_number=1),
+        id="round_without_map",
+    ),
+    pytest.param(
+        2, "upsert_economy",
+        make_economy_data(match_id=1, map_number=1, round_number=1, team_id=100),
+        id="economy_without_round",
+    ),
+]
 
-    def test_fk_round_without_map_raises(self, repo):
-        """upsert_round for non-existent (match_id, map_number) raises IntegrityError."""
-        repo.upsert_match(make_match_data(match_id=1))
-        with pytest.raises(sqlite3.IntegrityError):
-            repo.upsert_round(make_round_data(match_id=1, map_number=1, round_number=1))
 
-    def test_fk_economy_without_round_raises(self, repo):
-        """upsert_economy for non-existent round raises IntegrityError."""
-        repo.upsert_match(make_match_data(match_id=1))
-        repo.upsert_map(make_map_data(match_id=1, map_number=1))
-        # Round not inserted -- economy should fail
-        with pytest.raises(sqlite3.IntegrityError):
-            repo.upsert_economy(make_economy_data(
-                match_id=1, map_number=1, round_number=1, team_id=100,
-            ))
+class TestForeignKeys:
+    @pytest.mark.parametrize("n_parents, method, row", FK_CASES)
+    def test_fk_violation_raises(self, repo, n_parents, method, row):
+        """Upserting a row whose parent is missing raises IntegrityError."""
+        for parent_method, parent_row in _PARENT_ROWS[:n_parents]:
+            getattr(repo, parent_method)(parent_row)
+        with pytest.raises(psycopg2.IntegrityError):
+            getattr(repo, method)(row)
 
 
 # ---------------------------------------------------------------------------
@@ -399,10 +546,11 @@ class TestReadMethods:
 
     def test_get_maps_ordered(self, repo):
         """Insert maps out of order, get_maps returns them ordered by map_number."""
-        repo.upsert_match(make_match_data(match_id=1))
-        repo.upsert_map(make_map_data(match_id=1, map_number=3, map_name="Dust2"))
-        repo.upsert_map(make_map_data(match_id=1, map_number=1, map_name="Inferno"))
-        repo.upsert_map(make_map_data(match_id=1, map_number=2, map_name="Mirage"))
+        repo.upsert_match_maps(make_match_data(match_id=1), [
+            make_map_data(match_id=1, map_number=3, map_name="Dust2"),
+            make_map_data(match_id=1, map_number=1, map_name="Inferno"),
+            make_map_data(match_id=1, map_number=2, map_name="Mirage"),
+        ])
         maps = repo.get_maps(1)
         assert [m["map_number"] for m in maps] == [1, 2, 3]
 
@@ -412,8 +560,7 @@ class TestReadMethods:
 
     def test_count_matches_after_inserts(self, repo):
         """Insert 3 matches, count returns 3."""
-        for mid in [1, 2, 3]:
-            repo.upsert_match(make_match_data(match_id=mid))
+        repo.upsert_matches([make_match_data(match_id=mid) for mid in (1, 2, 3)])
         assert repo.count_matches() == 3
 
 
@@ -422,69 +569,67 @@ class TestReadMethods:
 # ---------------------------------------------------------------------------
 
 class TestNullableFields:
-    def test_upsert_player_stats_nullable_rating(self, repo):
-        """rating can be None."""
-        repo.upsert_match(make_match_data(match_id=1))
-        repo.upsert_map(make_map_data(match_id=1, map_number=1))
-        repo.upsert_player_stats(make_player_stats_data(
-            match_id=1, map_number=1, player_id=10,
-            rating=None,
-        ))
-        stats = repo.get_player_stats(1, 1)
-        assert len(stats) == 1
-        assert stats[0]["rating"] is None
-
-    def test_upsert_player_stats_partial_performance(self, repo):
-        """kpr, dpr can be None (populated later in Phase 7)."""
-        repo.upsert_match(make_match_data(match_id=1))
-        repo.upsert_map(make_map_data(match_id=1, map_number=1))
-        repo.upsert_player_stats(make_player_stats_data(
+    @pytest.mark.parametrize("null_fields", [
+        pytest.param(("rating",), id="rating"),
+        # Populated later in Phase 7
+        pytest.param(("kpr", "dpr"), id="partial_performance"),
+    ])
+    def test_upsert_player_stats_nullable(self, seeded_repo, null_fields):
+        """Player stats fields that may be missing persist as None."""
+        seeded_repo.upsert_player_stats(make_player_stats_data(
             match_id=1, map_number=1, player_id=10,
-            kpr=None, dpr=None,
+            **dict.fromkeys(null_fields),
         ))
-        stats = repo.get_player_stats(1, 1)
+        stats = seeded_repo.get_player_stats(1, 1)
         assert len(stats) == 1
-        assert stats[0]["kpr"] is None
-        assert stats[0]["dpr"] is None
+        for field in null_fields:
+            assert stats[0][field] is None
 
 
 # ---------------------------------------------------------------------------
 # UPSERT - upsert_match_overview (atomic match + maps + vetoes)
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="class")
+def overview_payload():
+    """Match + 3 maps + 7 vetoes, built once for the class (read-only)."""
+    match = make_match_data(match_id=1)
+    maps = [
+        make_map_data(match_id=1, map_number=i, map_name=name)
+        for i, name in enumerate(["Inferno", "Mirage", "Dust2"], 1)
+    ]
+    vetoes = [
+        make_veto_data(match_id=1, step_number=s, action=action, map_name=m)
+        for s, (action, m) in enumerate([
+            ("removed", "Nuke"),
+            ("removed", "Overpass"),
+            ("picked", "Inferno"),
+            ("picked", "Mirage"),
+            ("removed", "Vertigo"),
+            ("removed", "Ancient"),
+        ], 1)
+    ]
+    # The "left_over" step has no team
+    vetoes.append(make_veto_data(
+        match_id=1, step_number=7, action="left_over", map_name="Dust2",
+        team_name=None,
+    ))
+    return match, maps, vetoes
+
+
 class TestUpsertMatchOverview:
-    def test_upsert_match_overview_inserts_all_data(self, repo):
+    def test_upsert_match_overview_inserts_all_data(self, repo, overview_payload):
         """Insert match + 3 maps + 7 vetoes in one call."""
-        match = make_match_data(match_id=1)
-        maps = [
-            make_map_data(match_id=1, map_number=i, map_name=name)
-            for i, name in enumerate(["Inferno", "Mirage", "Dust2"], 1)
-        ]
-        vetoes = [
-            make_veto_data(match_id=1, step_number=s, action=action, map_name=m)
-            for s, (action, m) in enumerate([
-                ("removed", "Nuke"),
-                ("removed", "Overpass"),
-                ("picked", "Inferno"),
-                ("picked", "Mirage"),
-                ("removed", "Vertigo"),
-                ("removed", "Ancient"),
-                ("left_over", "Dust2"),
-            ], 1)
-        ]
-        # Set team_name=None for "left_over" step
-        vetoes[-1]["team_name"] = None
-
+        match, maps, vetoes = overview_payload
         repo.upsert_match_overview(match, maps, vetoes)
 
         assert repo.get_match(1) is not None
         assert len(repo.get_maps(1)) == 3
         assert len(repo.get_vetoes(1)) == 7
 
-    def test_upsert_match_overview_is_atomic(self, repo):
+    def test_upsert_match_overview_is_atomic(self, repo, overview_payload):
         """If a veto insert fails, nothing is written (transaction rollback)."""
-        match = make_match_data(match_id=1)
-        maps = [make_map_data(match_id=1, map_number=1)]
+        match, maps, _ = overview_payload
         # Bad veto data: missing required scraped_at field -> triggers error
         bad_veto = {
             "match_id": 1,
@@ -536,16 +681,14 @@ class TestVetoes:
     def test_get_vetoes_returns_ordered_steps(self, repo):
         """Insert 7 vetoes out of order, get_vetoes returns them by step_number."""
         repo.upsert_match(make_match_data(match_id=1))
-        # Insert in shuffled order
-        for step in [5, 2, 7, 1, 4, 6, 3]:
-            with repo.conn:
-                repo.conn.execute(
-                    "INSERT INTO vetoes (match_id, step_number, team_name, action, map_name, "
-                    "scraped_at, updated_at, source_url, parser_version) "
-                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                    (1, step, "TeamA", "removed", f"Map{step}",
-                     "2025-06-16T10:00:00Z", "2025-06-16T10:00:00Z", None, "0.1.0"),
-                )
+        # Insert in shuffled order, as one batch
+        rows = [
+            (1, step, "TeamA", "removed", f"Map{step}",
+             _SCRAPED_AT, _SCRAPED_AT, None, _PARSER_VERSION)
+            for step in [5, 2, 7, 1, 4, 6, 3]
+        ]
+        with repo.conn, repo.conn.cursor() as cur:
+            psycopg2.extras.execute_batch(cur, INSERT_VETO_POSITIONAL, rows)
 
         vetoes = repo.get_vetoes(1)
         assert len(vetoes) == 7
@@ -559,14 +702,8 @@ class TestVetoes:
         """A 'left_over' veto with team_name=None persists correctly."""
         repo.upsert_match(make_match_data(match_id=1))
         veto = make_veto_data(match_id=1, step_number=7, team_name=None, action="left_over")
-        with repo.conn:
-            repo.conn.execute(
-                "INSERT INTO vetoes (match_id, step_number, team_name, action, map_name, "
-                "scraped_at, updated_at, source_url, parser_version) "
-                "VALUES (:match_id, :step_number, :team_name, :action, :map_name, "
-                ":scraped_at, :scraped_at, :source_url, :parser_version)",
-                veto,
-            )
+        with repo.conn, repo.conn.cursor() as cur:
+            cur.execute(INSERT_VETO, veto)
 
         vetoes = repo.get_vetoes(1)
         assert len(vetoes) == 1
@@ -697,9 +834,7 @@ class TestUpsertMapStatsComplete:
         assert len(ps) == 5
 
         # Verify round_history
-        rh_count = repo.conn.execute(
-            "SELECT COUNT(*) FROM round_history WHERE match_id = 99999 AND map_number = 1"
-        ).fetchone()[0]
+        rh_count = fetch_one(repo.conn, COUNT_ROUNDS, (99999, 1))["n"]
         assert rh_count == 24
 
     def test_rollback_on_round_error(self, repo):
@@ -719,9 +854,7 @@ class TestUpsertMapStatsComplete:
         # Neither player_stats nor rounds should have been persisted
         ps = repo.get_player_stats(99999, 1)
         assert ps == []
-        rh_count = repo.conn.execute(
-            "SELECT COUNT(*) FROM round_history WHERE match_id = 99999 AND map_number = 1"
-        ).fetchone()[0]
+        rh_count = fetch_one(repo.conn, COUNT_ROUNDS, (99999, 1))["n"]
         assert rh_count == 0
 
     def test_map_no_longer_pending_after_upsert(self, repo):
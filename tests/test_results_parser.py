@@ -2,24 +2,14 @@
 
 Tests parse_results_page() against real HTML samples from data/recon/.
 Samples are gzipped and gitignored; tests skip gracefully if missing.
+The parsed samples come from session fixtures in conftest.py.
 """
 
-import gzip
-from pathlib import Path
+from itertools import chain
 
 import pytest
 
-from scraper.discovery import DiscoveredMatch, parse_results_page
-
-RECON_DIR = Path(__file__).resolve().parent.parent / "data" / "recon"
-
-
-def load_sample(filename: str) -> str:
-    """Load a gzipped HTML sample from data/recon/."""
-    path = RECON_DIR / filename
-    if not path.exists():
-        pytest.skip(f"Sample HTML not found: {path}")
-    return gzip.decompress(path.read_bytes()).decode("utf-8")
+from scraper.discovery import parse_results_page
 
 
 # ---------------------------------------------------------------------------
@@ -30,21 +20,15 @@ def load_sample(filename: str) -> str:
 class TestParseResultsPageBasic:
     """Core extraction tests: correct entry count per page."""
 
-    def test_parse_offset_0_returns_100_entries(self):
+    def test_parse_offset_0_returns_100_entries(self, parsed_offset_0):
         """Page 1 has big-results (8 extra entries) that must be skipped."""
-        html = load_sample("results-offset-0.html.gz")
-        results = parse_results_page(html)
-        assert len(results) == 100
+        assert len(parsed_offset_0) == 100
 
-    def test_parse_offset_100_returns_100_entries(self):
-        html = load_sample("results-offset-100.html.gz")
-        results = parse_results_page(html)
-        assert len(results) == 100
+    def test_parse_offset_100_returns_100_entries(self, parsed_offset_100):
+        assert len(parsed_offset_100) == 100
 
-    def test_parse_offset_5000_returns_100_entries(self):
-        html = load_sample("results-offset-5000.html.gz")
-        results = parse_results_page(html)
-        assert len(results) == 100
+    def test_parse_offset_5000_returns_100_entries(self, parsed_offset_5000):
+        assert len(parsed_offset_5000) == 100
 
     def test_parse_empty_html_returns_empty(self):
         results = parse_results_page("<html><body></body></html>")
@@ -65,34 +49,18 @@ class TestParseResultsPageBasic:
 class TestDiscoveredMatchFields:
     """Field-level validation on parsed entries."""
 
-    def test_match_id_is_positive_integer(self):
-        html = load_sample("results-offset-0.html.gz")
-        results = parse_results_page(html)
-        for entry in results:
-            assert isinstance(entry.match_id, int)
-            assert entry.match_id > 0
-
-    def test_url_starts_with_matches(self):
-        html = load_sample("results-offset-0.html.gz")
-        results = parse_results_page(html)
-        for entry in results:
-            assert entry.url.startswith("/matches/")
-
-    def test_url_contains_match_id(self):
-        html = load_sample("results-offset-0.html.gz")
-        results = parse_results_page(html)
-        for entry in results:
-            assert str(entry.match_id) in entry.url
-
-    def test_timestamp_ms_is_reasonable(self):
-        """Timestamps should be 13-digit unix ms, post-2020."""
-        html = load_sample("results-offset-0.html.gz")
-        results = parse_results_page(html)
+    def test_entry_field_invariants(self, parsed_offset_0):
+        """Check every field invariant in a single pass over the entries."""
         min_ts = 1577836800000  # 2020-01-01 UTC
-        for entry in results:
-            assert isinstance(entry.timestamp_ms, int)
-            assert len(str(entry.timestamp_ms)) == 13
-            assert entry.timestamp_ms > min_ts
+        for entry in parsed_offset_0:
+            assert isinstance(entry.match_id, int), entry
+            assert entry.match_id > 0, entry
+            assert entry.url.startswith("/matches/"), entry
+            assert str(entry.match_id) in entry.url, entry
+            ts = entry.timestamp_ms
+            assert isinstance(ts, int), entry
+            assert 10**12 <= ts < 10**13, entry  # 13-digit unix ms
+            assert ts > min_ts, entry
 
 
 # ---------------------------------------------------------------------------
@@ -103,26 +71,19 @@ class TestDiscoveredMatchFields:
 class TestForfeitDetection:
     """Verify forfeit flag from map-text == 'def'."""
 
-    def test_forfeit_detection(self):
+    @pytest.mark.slow
+    def test_forfeit_detection(
+        self, parsed_offset_0, parsed_offset_100, parsed_offset_5000,
+    ):
         """Parse all samples; verify forfeit flag is set correctly."""
-        samples = [
-            "results-offset-0.html.gz",
-            "results-offset-100.html.gz",
-            "results-offset-5000.html.gz",
-        ]
-        all_entries: list[DiscoveredMatch] = []
-        for sample in samples:
-            html = load_sample(sample)
-            all_entries.extend(parse_results_page(html))
-
-        forfeits = [e for e in all_entries if e.is_forfeit]
-        non_forfeits = [e for e in all_entries if not e.is_forfeit]
+        non_forfeits = 0
+        for entry in chain(parsed_offset_0, parsed_offset_100, parsed_offset_5000):
+            # All entries must have is_forfeit as a bool
+            assert isinstance(entry.is_forfeit, bool)
+            non_forfeits += not entry.is_forfeit
 
         # Most entries should be non-forfeit
-        assert len(non_forfeits) > 0
-        # All entries must have is_forfeit as a bool
-        for entry in all_entries:
-            assert isinstance(entry.is_forfeit, bool)
+        assert non_forfeits > 0
 
 
 # ---------------------------------------------------------------------------
@@ -133,20 +94,12 @@ class TestForfeitDetection:
 class TestNoDuplicatesBigResults:
     """Ensure big-results section on page 1 doesn't cause duplicates."""
 
-    def test_no_duplicate_match_ids_page_1(self):
-        html = load_sample("results-offset-0.html.gz")
-        results = parse_results_page(html)
-        match_ids = [r.match_id for r in results]
-        assert len(set(match_ids)) == len(match_ids), (
-            f"Duplicate match_ids found: {len(match_ids)} total, "
-            f"{len(set(match_ids))} unique"
-        )
-
-    def test_no_duplicate_match_ids_page_2(self):
-        html = load_sample("results-offset-100.html.gz")
-        results = parse_results_page(html)
-        match_ids = [r.match_id for r in results]
-        assert len(set(match_ids)) == len(match_ids), (
-            f"Duplicate match_ids found: {len(match_ids)} total, "
-            f"{len(set(match_ids))} unique"
-        )
+    @pytest.mark.parametrize("page", [
+        pytest.param("parsed_offset_0", id="page_1"),
+        pytest.param("parsed_offset_100", id="page_2"),
+    ])
+    def test_no_duplicate_match_ids(self, request, page):
+        seen = set()
+        for r in request.getfixturevalue(page):
+            assert r.match_id not in seen, f"Duplicate match_id found: {r.match_id}"
+            seen.add(r.match_id)
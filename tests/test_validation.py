@@ -4,7 +4,7 @@ Tests validate_and_quarantine, validate_batch, check_player_count,
 and check_economy_alignment.
 """
 
-from unittest.mock import MagicMock
+from types import MappingProxyType
 
 import pytest
 
@@ -20,70 +20,84 @@ from scraper.validation import (
 # Fixtures
 # ---------------------------------------------------------------------------
 
-PROVENANCE = {
+# Read-only bases; tests build their own variants with {**base, ...}
+PROVENANCE = MappingProxyType({
     "scraped_at": "2026-02-16T00:00:00Z",
     "source_url": "https://www.hltv.org/matches/100/test",
     "parser_version": "1.0",
-}
-
-CTX = {"match_id": 100, "map_number": 1}
+})
+
+CTX = MappingProxyType({"match_id": 100, "map_number": 1})
+
+_VALID_MATCH = MappingProxyType({
+    "match_id": 100,
+    "date": "2026-01-15",
+    "event_id": 10,
+    "event_name": "Test Event",
+    "team1_id": 1,
+    "team1_name": "Team A",
+    "team2_id": 2,
+    "team2_name": "Team B",
+    "team1_score": 2,
+    "team2_score": 1,
+    "best_of": 3,
+    "is_lan": 1,
+    **PROVENANCE,
+})
+
+_VALID_PLAYER_STATS = MappingProxyType({
+    "match_id": 100,
+    "map_number": 1,
+    "player_id": 1001,
+    "player_name": "s1mple",
+    "team_id": 1,
+    "kills": 20,
+    "deaths": 10,
+    "assists": 3,
+    "flash_assists": 1,
+    "hs_kills": 10,
+    "kd_diff": 10,
+    "adr": 90.0,
+    "kast": 70.0,
+    "fk_diff": 2,
+    "rating": 1.2,
+    "kpr": 0.8,
+    "dpr": 0.5,
+    "opening_kills": 4,
+    "opening_deaths": 2,
+    "multi_kills": 2,
+    "clutch_wins": 1,
+    "traded_deaths": 3,
+    "round_swing": -0.3,
+    "mk_rating": 1.0,
+    **PROVENANCE,
+})
+
+
+class FakeRepo:
+    """Records quarantine rows instead of writing them anywhere."""
+
+    def __init__(self):
+        self.quarantined = []
+
+    def insert_quarantine(self, data: dict) -> None:
+        self.quarantined.append(data)
 
 
 @pytest.fixture
 def valid_match_data() -> dict:
-    return {
-        "match_id": 100,
-        "date": "2026-01-15",
-        "event_id": 10,
-        "event_name": "Test Event",
-        "team1_id": 1,
-        "team1_name": "Team A",
-        "team2_id": 2,
-        "team2_name": "Team B",
-        "team1_score": 2,
-        "team2_score": 1,
-        "best_of": 3,
-        "is_lan": 1,
-        **PROVENANCE,
-    }
+    return {**_VALID_MATCH}
 
 
 @pytest.fixture
-def invalid_match_data(valid_match_data) -> dict:
+def invalid_match_data() -> dict:
     """Match with match_id=0 (triggers ValidationError)."""
-    valid_match_data["match_id"] = 0
-    return valid_match_data
+    return {**_VALID_MATCH, "match_id": 0}
 
 
 @pytest.fixture
 def valid_player_stats_data() -> dict:
-    return {
-        "match_id": 100,
-        "map_number": 1,
-        "player_id": 1001,
-        "player_name": "s1mple",
-        "team_id": 1,
-        "kills": 20,
-        "deaths": 10,
-        "assists": 3,
-        "flash_assists": 1,
-        "hs_kills": 10,
-        "kd_diff": 10,
-        "adr": 90.0,
-        "kast": 70.0,
-        "fk_diff": 2,
-        "rating": 1.2,
-        "kpr": 0.8,
-        "dpr": 0.5,
-        "opening_kills": 4,
-        "opening_deaths": 2,
-        "multi_kills": 2,
-        "clutch_wins": 1,
-        "traded_deaths": 3,
-        "round_swing": -0.3,
-        "mk_rating": 1.0,
-        **PROVENANCE,
-    }
+    return {**_VALID_PLAYER_STATS}
 
 
 # ===================================================================
@@ -99,13 +113,13 @@ class TestValidateAndQuarantine:
         assert result["match_id"] == 100
 
     def test_invalid_returns_none_and_quarantines(self, invalid_match_data):
-        repo = MagicMock()
+        repo = FakeRepo()
         result = validate_and_quarantine(
             invalid_match_data, MatchModel, CTX, repo
         )
         assert result is None
-        repo.insert_quarantine.assert_called_once()
-        q_data = repo.insert_quarantine.call_args[0][0]
+        assert len(repo.quarantined) == 1
+        q_data = repo.quarantined[0]
         assert q_data["entity_type"] == "MatchModel"
         assert q_data["match_id"] == 100
         assert q_data["resolved"] == 0
@@ -133,31 +147,28 @@ class TestValidateAndQuarantine:
 
 class TestValidateBatch:
     def test_mixed_batch(self, valid_match_data):
-        invalid = valid_match_data.copy()
-        invalid["match_id"] = 0  # Will fail validation
+        invalid = {**valid_match_data, "match_id": 0}  # Will fail validation
 
         items = [valid_match_data, invalid]
-        repo = MagicMock()
+        repo = FakeRepo()
         valid, quarantine_count = validate_batch(
             items, MatchModel, CTX, repo
         )
         assert len(valid) == 1
         assert quarantine_count == 1
+        assert len(repo.quarantined) == 1
         assert valid[0]["match_id"] == 100
 
     def test_all_valid(self, valid_match_data):
-        items = [valid_match_data.copy(), valid_match_data.copy()]
         # Give second item a different match_id to avoid duplicate key issues
-        items[1]["match_id"] = 200
+        items = [valid_match_data, {**valid_match_data, "match_id": 200}]
         valid, quarantine_count = validate_batch(items, MatchModel, CTX)
         assert len(valid) == 2
         assert quarantine_count == 0
 
     def test_all_invalid(self, valid_match_data):
-        invalid1 = valid_match_data.copy()
-        invalid1["match_id"] = 0
-        invalid2 = valid_match_data.copy()
-        invalid2["match_id"] = -5
+        invalid1 = {**valid_match_data, "match_id": 0}
+        invalid2 = {**valid_match_data, "match_id": -5}
         valid, quarantine_count = validate_batch(
             [invalid1, invalid2], MatchModel, CTX
         )
@@ -172,19 +183,18 @@ class TestValidateBatch:
 
 class TestCheckPlayerCount:
     def test_exactly_10(self, valid_player_stats_data):
-        stats = []
-        for i in range(10):
-            row = valid_player_stats_data.copy()
-            row["player_id"] = 1000 + i
-            row["team_id"] = 1 if i < 5 else 2
-            row["kd_diff"] = row["kills"] - row["deaths"]
-            stats.append(row)
+        base = valid_player_stats_data
+        kd_diff = base["kills"] - base["deaths"]
+        stats = [
+            {**base, "player_id": 1000 + i, "team_id": 1 if i < 5 else 2, "kd_diff": kd_diff}
+            for i in range(10)
+        ]
 
         warnings = check_player_count(stats, 100, 1)
         assert warnings == []
 
     def test_not_10(self, valid_player_stats_data):
-        stats = [valid_player_stats_data.copy() for _ in range(8)]
+        stats = [{**valid_player_stats_data} for _ in range(8)]
         warnings = check_player_count(stats, 100, 1)
         assert len(warnings) == 1
         assert "Expected 10" in warnings[0]